@@ -4,18 +4,42 @@ Generate audio files for consensus disagreement visualization.
 Creates audio with multiple voice instances speaking together - crowd simulation.
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import csv
+import hashlib
+import io
+import math
+import multiprocessing
+import os
 from pathlib import Path
 import random
+import subprocess
+import tempfile
+import threading
+import time
 
-from gtts import gTTS
-from pydub import AudioSegment
+from gtts import gTTS, gTTSError
+import numpy as np
 
 # Configuration
 CSV_FILE = 'consensus_data.csv'
 AUDIO_DIR = 'audio'
 TEMP_DIR = 'audio/temp'
 NUM_VOICES = 100  # Total number of simulated voices
+TTS_MAX_RETRIES = 5  # Attempts per TTS request when rate limited (HTTP 429)
+TTS_MAX_CONCURRENT = 8  # TTS requests in flight at once across all workers
+SAMPLE_RATE = 16000  # Mono PCM rate for all mixing and output; gTTS's 24kHz is resampled once on decode
+FFMPEG_BUFSIZE = 1 << 20  # Pipe buffer size for ffmpeg subprocesses
+CROWD_LAYERS = 50  # Copies layered into each crowd texture
+VARIATION_MS = 30  # Max random onset delay per voice, so voices aren't in lockstep
+MP3_VBR_QUALITY = '5'  # lame VBR quality (-q:a); 0 is best, 9 is smallest/fastest
+
+# Random source for voice onset offsets; reseeded in each worker process
+rng = np.random.default_rng()
+
+# Limits concurrent TTS requests; replaced by a semaphore shared across
+# worker processes when running under the process pool
+tts_slots = threading.Semaphore(TTS_MAX_CONCURRENT)
 
 # Available gTTS voice variants (TLD variations)
 VOICE_VARIANTS = [
@@ -31,110 +55,229 @@ def ensure_directories():
     Path(AUDIO_DIR).mkdir(exist_ok=True)
     Path(TEMP_DIR).mkdir(exist_ok=True)
 
-def load_csv_data():
-    """Load consensus data from CSV file."""
-    data = []
+def init_worker(shared_tts_slots):
+    """
+    Set up a worker process: share the TTS concurrency limit with the other
+    workers and give it its own RNG state (forked workers inherit the parent's).
+    """
+    global rng, tts_slots
+    rng = np.random.default_rng()
+    tts_slots = shared_tts_slots
+
+def iter_csv_data():
+    """Yield consensus data rows from the CSV file one at a time."""
     with open(CSV_FILE, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append(row)
-    return data
+        yield from csv.DictReader(f)
 
-def generate_tts(text, filename, voice_type='com'):
-    """Generate text-to-speech audio file with specified voice."""
-    try:
-        tts = gTTS(text=text, lang='en', tld=voice_type, slow=False)
-        tts.save(filename)
-        return True
-    except Exception as e:
-        print(f"  Error generating TTS: {e}")
-        return False
+def tts_cache_path(text, voice_type):
+    """Path of the cached TTS mp3 for this text and voice."""
+    key = hashlib.sha1(f"{text}|{voice_type}".encode('utf-8')).hexdigest()
+    return Path(TEMP_DIR) / f"{key}.mp3"
 
-def add_slight_variation(audio, variation_ms=50):
+def write_cache_file(path, data):
     """
-    Add slight timing variation to make voices more natural.
-    Adds random padding before the audio.
+    Write data to path atomically: write a temporary file in the same directory
+    and rename it into place, so readers never see a partially written file.
     """
-    padding = random.randint(0, variation_ms)
-    silence = AudioSegment.silent(duration=padding)
-    return silence + audio
-
-def create_crowd_audio(base_audio, num_copies, add_variation=True):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+def generate_tts(text, voice_type='com', log=print):
     """
-    Create a crowd effect by layering multiple copies of the same audio.
+    Generate text-to-speech audio with specified voice, returned as mp3 bytes
+    (None on failure). Results are cached in TEMP_DIR keyed by text and voice,
+    so reruns and repeated statements don't hit the TTS API again.
+    Progress and errors go to log.
+    """
+    cached = tts_cache_path(text, voice_type)
+    if cached.exists():
+        try:
+            return cached.read_bytes()
+        except OSError as e:
+            log(f"  Warning: could not read cached TTS audio ({voice_type}), fetching again: {e}")
+
+    for attempt in range(TTS_MAX_RETRIES):
+        # Small random delay so parallel workers don't hit Google in lockstep
+        time.sleep(random.uniform(0.5, 1.0))
+        try:
+            with tts_slots:
+                tts = gTTS(text=text, lang='en', tld=voice_type, slow=False)
+                buffer = io.BytesIO()
+                tts.write_to_fp(buffer)
+        except gTTSError as e:
+            if e.rsp is not None and e.rsp.status_code == 429 and attempt < TTS_MAX_RETRIES - 1:
+                log(f"  Rate limited by TTS API ({voice_type}), retrying ({attempt + 1}/{TTS_MAX_RETRIES})...")
+                # Exponential backoff with jitter so throttled workers spread out
+                time.sleep(2 ** attempt + random.random())
+                continue
+            log(f"  Error generating TTS ({voice_type}): {e}")
+            return None
+        except Exception as e:
+            log(f"  Error generating TTS ({voice_type}): {e}")
+            return None
+
+        data = buffer.getvalue()
+        # The cache is only an optimization; a failed write shouldn't discard
+        # audio that was already downloaded
+        try:
+            write_cache_file(cached, data)
+        except OSError as e:
+            log(f"  Warning: could not cache TTS audio ({voice_type}): {e}")
+        return data
+    return None
+
+def decode_mp3(data):
+    """Decode in-memory mp3 bytes to mono 16-bit PCM samples, piped through ffmpeg."""
+    cmd = [
+        'ffmpeg', '-v', 'error', '-f', 'mp3', '-i', 'pipe:0',
+        '-f', 's16le', '-ar', str(SAMPLE_RATE), '-ac', '1', 'pipe:1',
+    ]
+    proc = subprocess.Popen(
+        cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=FFMPEG_BUFSIZE
+    )
+    out, err = proc.communicate(data)
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to decode mp3: {err.decode(errors='replace').strip()}")
+    return np.frombuffer(out, dtype=np.int16)
+
+def load_tts_pcm(text, voice_type='com', log=print):
+    """
+    Generate (or fetch from cache) TTS audio and decode it to PCM samples.
+    Returns None on failure. Audio that ffmpeg can't decode is dropped from
+    the cache so the next run fetches it again instead of failing every time.
+    """
+    data = generate_tts(text, voice_type, log)
+    if data is None:
+        return None
+    try:
+        return decode_mp3(data)
+    except RuntimeError as e:
+        log(f"  Error decoding TTS audio ({voice_type}): {e}")
+        tts_cache_path(text, voice_type).unlink(missing_ok=True)
+        return None
+
+def write_mp3(pcm, path):
+    """Encode mono PCM samples to an mp3 file with ffmpeg, clipping to 16-bit."""
+    cmd = [
+        'ffmpeg', '-v', 'error', '-y',
+        '-f', 's16le', '-ar', str(SAMPLE_RATE), '-ac', '1', '-i', 'pipe:0',
+        '-codec:a', 'libmp3lame', '-q:a', MP3_VBR_QUALITY, str(path),
+    ]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=FFMPEG_BUFSIZE)
+    _, err = proc.communicate(np.clip(pcm, -32768, 32767).astype(np.int16).tobytes())
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to encode {path}: {err.decode(errors='replace').strip()}")
+
+def create_crowd_texture(base_pcm, add_variation=True):
+    """
+    Layer CROWD_LAYERS slightly offset copies of the same audio into a crowd
+    texture with the same energy as a single voice. Built once per voice and
+    then scaled to each crowd size by create_crowd_audio(), rather than
+    re-layered per crowd.
+    """
+    # Sum every shifted layer into one float32 buffer
+    samples = base_pcm.astype(np.float32)
+    max_offset = VARIATION_MS * SAMPLE_RATE // 1000 if add_variation else 0
+    num_samples = len(samples)
+    acc = np.zeros(num_samples + max_offset, dtype=np.float32)
+
+    offsets = rng.integers(0, max_offset, size=CROWD_LAYERS, endpoint=True)
+    for offset in offsets:
+        acc[offset:offset + num_samples] += samples
+
+    # Stacking the layers raises the energy by roughly CROWD_LAYERS times
+    # (less where the offset copies partly cancel). Take exactly that back
+    # out with one gain, so a crowd of N built from this texture sits at
+    # 10 * log10(N) dB relative to the single-voice path
+    base_energy = np.square(samples, dtype=np.float64).sum()
+    texture_energy = np.square(acc, dtype=np.float64).sum()
+    if texture_energy > 0:
+        acc *= np.float32(math.sqrt(base_energy / texture_energy))
+
+    return acc
+
+def create_crowd_audio(base_pcm, num_copies, add_variation=True, texture=None):
+    """
+    Create a crowd effect of num_copies voices from a layered crowd texture.
     Uses proper acoustic scaling: doubling people = +3dB
 
     For incoherent sources (people speaking slightly out of sync):
     - Sound intensity adds linearly
     - Each doubling of sources adds ~3dB
     - Formula: dB increase = 10 * log10(N) where N is number of sources
+
+    Pass a texture from create_crowd_texture() to reuse it across crowd sizes;
+    otherwise one is built from base_pcm.
     """
     if num_copies == 0:
-        return AudioSegment.silent(duration=len(base_audio))
+        return np.zeros(len(base_pcm), dtype=np.float32)
 
     if num_copies == 1:
-        return add_slight_variation(base_audio, 30) if add_variation else base_audio
+        if not add_variation:
+            return base_pcm.astype(np.float32)
+        # Delay the single voice by a random onset, written straight into a
+        # zeroed buffer
+        offset = int(rng.integers(0, VARIATION_MS * SAMPLE_RATE // 1000, endpoint=True))
+        delayed = np.zeros(len(base_pcm) + offset, dtype=np.float32)
+        delayed[offset:] = base_pcm
+        return delayed
 
     # For realistic crowd sound, we don't need to layer 1000 copies
-    # Instead, layer a reasonable number and adjust the volume
-    # Use square root scaling for number of actual layers (diminishing returns)
-    num_layers = min(int(num_copies ** 0.5), 50)  # Cap at 50 layers for performance
+    # Instead, layer a fixed number once and adjust the volume
+    if texture is None:
+        texture = create_crowd_texture(base_pcm, add_variation)
 
-    # Calculate the volume boost based on the ACTUAL crowd size
+    # Boost the texture by the theoretical crowd size
     # 10 * log10(N) gives us the dB increase for N incoherent sources
-    import math
     db_increase = 10 * math.log10(num_copies)
 
-    # Start with the first copy
-    result = add_slight_variation(base_audio, 30) if add_variation else base_audio
-
-    # Layer additional copies with slight volume reduction per layer
-    # This prevents clipping while still getting the crowd effect
-    for _ in range(1, num_layers):
-        copy = add_slight_variation(base_audio, 30) if add_variation else base_audio
-        # Each layer slightly quieter to prevent clipping
-        copy = copy - (3 * math.log10(num_layers))
-        result = result.overlay(copy)
-
-    # Now boost the entire result by the theoretical crowd size
-    result = result + db_increase
+    return texture * np.float32(10 ** (db_increase / 20))
 
-    return result
-
-def mix_agree_disagree_crowds(agree_audio, disagree_audio):
+def mix_agree_disagree_crowds(agree_pcm, disagree_pcm):
     """
     Mix two crowd audios together.
-    The crowd sizes are already represented in the layering - just overlay them directly.
+    The crowd sizes are already represented in the layering - just sum them directly.
     """
-    # Make them the same length
-    max_length = max(len(agree_audio), len(disagree_audio))
-
-    if len(agree_audio) < max_length:
-        agree_audio = agree_audio + AudioSegment.silent(duration=max_length - len(agree_audio))
-    if len(disagree_audio) < max_length:
-        disagree_audio = disagree_audio + AudioSegment.silent(duration=max_length - len(disagree_audio))
-
-    # Simply overlay the two crowds - their volumes are already correct
-    # from the number of voices layered in create_crowd_audio()
-    mixed = agree_audio.overlay(disagree_audio)
-
-    # Normalize to prevent clipping
-    if mixed.max_dBFS > -1:
-        mixed = mixed.normalize(headroom=1.0)
-
+    # Sum the two crowds into one buffer sized for the longer one.
+    # Their volumes are already correct from create_crowd_audio()
+    mixed = np.zeros(max(len(agree_pcm), len(disagree_pcm)), dtype=np.float32)
+    mixed[:len(agree_pcm)] += agree_pcm
+    mixed[:len(disagree_pcm)] += disagree_pcm
     return mixed
 
-def generate_audio_for_issue(issue_data, index):
-    """Generate all audio files for a single issue using crowd simulation."""
-    issue_name = issue_data['issue'].replace(' ', '_').replace('/', '_')
+def fit_to_headroom(*tracks):
+    """
+    Scale tracks in place by one shared gain so the loudest peak among them
+    sits at 1dB of headroom, if any goes above it. Sharing the gain keeps
+    the tracks' levels relative to each other, so a perspective's agree,
+    disagree and both files play at matching volumes.
+    """
+    target_peak = 32768 * 10 ** (-1.0 / 20)
+    peak = max(float(np.abs(track).max()) for track in tracks)
+    if peak > target_peak:
+        gain = np.float32(target_peak / peak)
+        for track in tracks:
+            track *= gain
+
+def generate_audio_for_issue(issue_data, index, log=print):
+    """
+    Generate all audio files for a single issue using crowd simulation.
+    Progress and errors go to log.
+    """
     statement = issue_data['statement']
 
     sci_consensus = float(issue_data['scientific_consensus'])
     pub_agreement = float(issue_data['public_agreement'])
 
-    print(f"\nGenerating audio for: {issue_data['issue']}")
-    print(f"  Scientific: {sci_consensus}% agree")
-    print(f"  Public: {pub_agreement}% agree")
+    log(f"\nGenerating audio for: {issue_data['issue']}")
+    log(f"  Scientific: {sci_consensus}% agree")
+    log(f"  Public: {pub_agreement}% agree")
 
     # Calculate number of voices for each group
     sci_agree_count = round(NUM_VOICES * sci_consensus / 100)
@@ -142,91 +285,81 @@ def generate_audio_for_issue(issue_data, index):
     pub_agree_count = round(NUM_VOICES * pub_agreement / 100)
     pub_disagree_count = NUM_VOICES - pub_agree_count
 
-    print(f"  Simulating {NUM_VOICES} voices:")
-    print(f"    Scientific: {sci_agree_count} agree, {sci_disagree_count} disagree")
-    print(f"    Public: {pub_agree_count} agree, {pub_disagree_count} disagree")
+    log(f"  Simulating {NUM_VOICES} voices:")
+    log(f"    Scientific: {sci_agree_count} agree, {sci_disagree_count} disagree")
+    log(f"    Public: {pub_agree_count} agree, {pub_disagree_count} disagree")
 
-    # Generate base TTS files with different voices
+    # Generate base TTS audio with different voices
     agree_text = f"I believe {statement}"
     disagree_text = f"I don't believe {statement}"
 
-    agree_temp = f"{TEMP_DIR}/{issue_name}_agree.mp3"
-    disagree_temp = f"{TEMP_DIR}/{issue_name}_disagree.mp3"
-
-    print("  Generating base TTS files...")
-    if not generate_tts(agree_text, agree_temp, voice_type='com'):
-        return False
-    if not generate_tts(disagree_text, disagree_temp, voice_type='co.uk'):
+    log("  Generating base TTS audio...")
+    # Both requests are network-bound, so issue them concurrently. The mp3s
+    # are decoded straight from memory; everything from here until the final
+    # encode stays as NumPy PCM
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        agree_future = executor.submit(load_tts_pcm, agree_text, 'com', log)
+        disagree_future = executor.submit(load_tts_pcm, disagree_text, 'co.uk', log)
+        agree_base = agree_future.result()
+        disagree_base = disagree_future.result()
+    if agree_base is None or disagree_base is None:
         return False
 
-    # Load base audio
-    agree_base = AudioSegment.from_mp3(agree_temp)
-    disagree_base = AudioSegment.from_mp3(disagree_temp)
-
-    # Generate Scientific audio files
-    print("  Creating scientific consensus crowds...")
-
-    # Just agree
-    if sci_agree_count > 0:
-        sci_agree_crowd = create_crowd_audio(agree_base, sci_agree_count, add_variation=True)
-        sci_agree_file = f"{AUDIO_DIR}/{index:02d}_sci_agree.mp3"
-        sci_agree_crowd.export(sci_agree_file, format='mp3')
-    else:
-        # Silent if 0%
-        AudioSegment.silent(duration=len(agree_base)).export(
-            f"{AUDIO_DIR}/{index:02d}_sci_agree.mp3", format='mp3'
-        )
-
-    # Just disagree
-    if sci_disagree_count > 0:
-        sci_disagree_crowd = create_crowd_audio(disagree_base, sci_disagree_count, add_variation=True)
-        sci_disagree_file = f"{AUDIO_DIR}/{index:02d}_sci_disagree.mp3"
-        sci_disagree_crowd.export(sci_disagree_file, format='mp3')
-    else:
-        AudioSegment.silent(duration=len(disagree_base)).export(
-            f"{AUDIO_DIR}/{index:02d}_sci_disagree.mp3", format='mp3'
-        )
+    # Layer each voice once; every crowd below is this texture re-gained
+    agree_texture = create_crowd_texture(agree_base, add_variation=True)
+    disagree_texture = create_crowd_texture(disagree_base, add_variation=True)
 
-    # Both together
-    print("  Mixing scientific agree + disagree...")
-    sci_agree_for_mix = create_crowd_audio(agree_base, sci_agree_count, add_variation=True) if sci_agree_count > 0 else AudioSegment.silent(duration=len(agree_base))
-    sci_disagree_for_mix = create_crowd_audio(disagree_base, sci_disagree_count, add_variation=True) if sci_disagree_count > 0 else AudioSegment.silent(duration=len(disagree_base))
-    sci_both = mix_agree_disagree_crowds(sci_agree_for_mix, sci_disagree_for_mix)
-    sci_both.export(f"{AUDIO_DIR}/{index:02d}_sci_both.mp3", format='mp3')
+    # Generate Scientific audio files (silent if 0%)
+    log("  Creating scientific consensus crowds...")
+    sci_agree_crowd = create_crowd_audio(agree_base, sci_agree_count, texture=agree_texture)
+    sci_disagree_crowd = create_crowd_audio(disagree_base, sci_disagree_count, texture=disagree_texture)
+
+    # Both together - reuse the crowds built above rather than re-layering
+    log("  Mixing scientific agree + disagree...")
+    sci_both = mix_agree_disagree_crowds(sci_agree_crowd, sci_disagree_crowd)
+    # Normalize to prevent clipping, with one gain for all three files
+    fit_to_headroom(sci_agree_crowd, sci_disagree_crowd, sci_both)
 
     # Generate Public audio files
-    print("  Creating public opinion crowds...")
-
-    # Just agree
-    if pub_agree_count > 0:
-        pub_agree_crowd = create_crowd_audio(agree_base, pub_agree_count, add_variation=True)
-        pub_agree_file = f"{AUDIO_DIR}/{index:02d}_pub_agree.mp3"
-        pub_agree_crowd.export(pub_agree_file, format='mp3')
-    else:
-        AudioSegment.silent(duration=len(agree_base)).export(
-            f"{AUDIO_DIR}/{index:02d}_pub_agree.mp3", format='mp3'
-        )
-
-    # Just disagree
-    if pub_disagree_count > 0:
-        pub_disagree_crowd = create_crowd_audio(disagree_base, pub_disagree_count, add_variation=True)
-        pub_disagree_file = f"{AUDIO_DIR}/{index:02d}_pub_disagree.mp3"
-        pub_disagree_crowd.export(pub_disagree_file, format='mp3')
-    else:
-        AudioSegment.silent(duration=len(disagree_base)).export(
-            f"{AUDIO_DIR}/{index:02d}_pub_disagree.mp3", format='mp3'
-        )
+    log("  Creating public opinion crowds...")
+    pub_agree_crowd = create_crowd_audio(agree_base, pub_agree_count, texture=agree_texture)
+    pub_disagree_crowd = create_crowd_audio(disagree_base, pub_disagree_count, texture=disagree_texture)
 
     # Both together
-    print("  Mixing public agree + disagree...")
-    pub_agree_for_mix = create_crowd_audio(agree_base, pub_agree_count, add_variation=True) if pub_agree_count > 0 else AudioSegment.silent(duration=len(agree_base))
-    pub_disagree_for_mix = create_crowd_audio(disagree_base, pub_disagree_count, add_variation=True) if pub_disagree_count > 0 else AudioSegment.silent(duration=len(disagree_base))
-    pub_both = mix_agree_disagree_crowds(pub_agree_for_mix, pub_disagree_for_mix)
-    pub_both.export(f"{AUDIO_DIR}/{index:02d}_pub_both.mp3", format='mp3')
-
-    print(f"  ✓ Generated 6 audio files for {issue_data['issue']}")
+    log("  Mixing public agree + disagree...")
+    pub_both = mix_agree_disagree_crowds(pub_agree_crowd, pub_disagree_crowd)
+    fit_to_headroom(pub_agree_crowd, pub_disagree_crowd, pub_both)
+
+    # Each export is an independent ffmpeg subprocess, so encode all six at once
+    log("  Encoding mp3 files...")
+    exports = [
+        (sci_agree_crowd, f"{AUDIO_DIR}/{index:02d}_sci_agree.mp3"),
+        (sci_disagree_crowd, f"{AUDIO_DIR}/{index:02d}_sci_disagree.mp3"),
+        (sci_both, f"{AUDIO_DIR}/{index:02d}_sci_both.mp3"),
+        (pub_agree_crowd, f"{AUDIO_DIR}/{index:02d}_pub_agree.mp3"),
+        (pub_disagree_crowd, f"{AUDIO_DIR}/{index:02d}_pub_disagree.mp3"),
+        (pub_both, f"{AUDIO_DIR}/{index:02d}_pub_both.mp3"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+        list(executor.map(lambda job: write_mp3(*job), exports))
+
+    log(f"  ✓ Generated 6 audio files for {issue_data['issue']}")
     return True
 
+def run_issue(issue_data, index):
+    """
+    Process pool entry point for one issue. Buffers the issue's output so main
+    can print it as one block instead of interleaving it with other workers.
+    Returns (success, output).
+    """
+    lines = []
+    try:
+        success = generate_audio_for_issue(issue_data, index, log=lines.append)
+    except Exception as e:
+        lines.append(f"  Error: {e}")
+        success = False
+    return success, '\n'.join(lines)
+
 def main():
     """Main function to generate all audio files."""
     print("Consensus Disagreement Audio Generator")
@@ -237,16 +370,39 @@ def main():
     ensure_directories()
 
     print(f"\nLoading data from {CSV_FILE}...")
-    data = load_csv_data()
-    print(f"Found {len(data)} issues")
 
+    # Issues are independent, so process them in parallel: TTS network
+    # latency and ffmpeg encoding overlap across worker processes.
+    # Rows are submitted as they are read, so work starts on the first one
+    # without waiting for the whole file
     success_count = 0
-    for index, issue in enumerate(data):
-        if generate_audio_for_issue(issue, index):
-            success_count += 1
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=init_worker,
+        initargs=(multiprocessing.Semaphore(TTS_MAX_CONCURRENT),),
+    ) as executor:
+        futures = {}
+        for index, issue in enumerate(iter_csv_data()):
+            future = executor.submit(run_issue, issue, index)
+            futures[future] = f"{index:02d} {issue['issue']}"
+        print(f"Found {len(futures)} issues")
+
+        failed = []
+        for future in as_completed(futures):
+            success, output = future.result()
+            print(output)
+            if success:
+                success_count += 1
+            else:
+                print(f"  ✗ Failed: {futures[future]}")
+                failed.append(futures[future])
 
     print("\n" + "=" * 50)
-    print(f"Generation complete: {success_count}/{len(data)} issues processed")
+    print(f"Generation complete: {success_count}/{len(futures)} issues processed")
+    if failed:
+        print("Failed issues:")
+        for label in sorted(failed):
+            print(f"  {label}")
     print(f"Audio files saved to: {AUDIO_DIR}/")
     print("\nFile naming convention:")
     print("  XX_sci_agree.mp3   - Scientific consensus agree voices")